@@ -30,6 +30,8 @@ def main() -> None:
         port=settings.port,
         reload=settings.reload,
         log_level=settings.log_level.value.lower(),
+        loop="uvloop",
+        http="httptools",
         factory=True,
     )
 
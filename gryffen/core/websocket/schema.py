@@ -21,6 +21,10 @@ import json
 
 class FinnhubWS:
 
+    # One instance is allocated per websocket message; __slots__ drops the
+    # per-instance __dict__ to keep heap traffic low on that path.
+    __slots__ = ("signals", "type")
+
     def __init__(self, stream_data) -> None:
         data = json.loads(stream_data)
         self.signals = []
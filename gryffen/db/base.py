@@ -19,8 +19,28 @@
 from sqlalchemy.orm import DeclarativeBase
 from gryffen.db.meta import meta
 
+# Columns that must never leave the database layer in a serialized row;
+# the password hash is raw bytes and the API key is a bearer secret.
+SENSITIVE_COLUMNS = frozenset({"password", "api_key"})
+
 
 class Base(DeclarativeBase):
     """Base for all models."""
 
     metadata = meta
+
+    def to_dict(self) -> dict:
+        """Serializes the model's column values into a plain dict.
+
+        Reads each mapped column attribute directly instead of relying on
+        reflective encoders such as `jsonable_encoder`, which keeps response
+        serialization a single pass over the row. Credential columns are
+        omitted so a serialized row never echoes secrets to a client.
+
+        :return: dict keyed by column name.
+        """
+        return {
+            column.name: getattr(self, column.name)
+            for column in self.__table__.columns
+            if column.name not in SENSITIVE_COLUMNS
+        }
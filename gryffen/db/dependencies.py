@@ -26,10 +26,16 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
     """
     Create and get database session.
 
+    The session factory is an `async_scoped_session` scoped to the current
+    asyncio task, so repeated resolutions within one request share a single
+    session; `remove()` closes it and resets the scope once the request is
+    done.
+
     :param request: current request.
     :yield: database session.
     """
-    session: AsyncSession = request.app.state.db_session_factory()
+    session_factory = request.app.state.db_session_factory
+    session: AsyncSession = session_factory()
 
     try:  # noqa: WPS501
         yield session
@@ -38,4 +44,4 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
         raise e
     finally:
         await session.commit()
-        await session.close()
+        await session_factory.remove()
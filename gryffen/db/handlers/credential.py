@@ -16,39 +16,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any
+from typing import Dict
 from typing import List
 from datetime import datetime
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from gryffen.security import TokenBase
 from gryffen.db.models.users import User
 from gryffen.db.models.exchanges import Exchange
 from gryffen.db.models.credentials import Credential
-from gryffen.web.api.v1.credential.schema import CredentialCreationSchema
 
 
 async def create_credential(
     user_id: User.id,
-    submission: CredentialCreationSchema,
+    submission: Dict[str, Any],
     db: AsyncSession,
 ) -> Credential:
     """Creates a new credential for a specific exchange under a user.
 
     Args:
         user_id: The ID of the user.
-        submission: The schema object that contains the credential data.
+        submission: The credential data, dumped once from the creation schema.
         db: The database session object.
 
     Returns:
         The created credential.
     """
     credential = Credential(
-        exchange_id=submission.exchange_id,
-        credential=submission.credential,
-        type=submission.type,
-        scope=submission.scope,
-        expires_at=submission.expires_at,
+        exchange_id=submission["exchange_id"],
+        credential=submission["credential"],
+        type=submission["type"],
+        scope=submission["scope"],
+        expires_at=submission["expires_at"],
         timestamp_created=datetime.utcnow(),
         timestamp_updated=datetime.utcnow(),
         owner_id=user_id
@@ -75,14 +75,13 @@ async def get_credentials_by_token(
         The list of credentials.
     """
     stmt = (
-        select(User)
+        select(Credential)
+        .join(User, Credential.owner_id == User.id)
         .where(User.public_id == user_info.public_id)
-        .options(
-            selectinload(User.credentials)
-        )
+        .execution_options(yield_per=200)
     )
-    user_obj: User = await db.scalar(stmt)
-    return user_obj.credentials
+    result = await db.stream_scalars(stmt)
+    return [credential async for credential in result]
 
 
 async def get_credential_by_exchange_id(
@@ -16,36 +16,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any
+from typing import Dict
 from typing import List
 from datetime import datetime
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from gryffen.db.models.exchanges import Exchange
 from gryffen.db.models.users import User
 from gryffen.security import TokenBase
-from gryffen.web.api.v1.exchange.schema import ExchangeCreationSchema
 
 
 async def create_exchange(
     user_id: int,
-    submission: ExchangeCreationSchema,
+    submission: Dict[str, Any],
     db: AsyncSession,
 ) -> Exchange:
     """Creates a new exchange broker.
 
     Args:
         user_id: The user id.
-        submission: The exchange submission.
+        submission: The exchange data, dumped once from the creation schema.
         db: The database session object.
 
     Returns:
         The created exchange.
     """
     exchange = Exchange(
-        name=submission.name,
-        type=submission.type,
-        account_id=submission.account_id,
+        name=submission["name"],
+        type=submission["type"],
+        account_id=submission["account_id"],
         timestamp_created=datetime.utcnow(),
         timestamp_updated=datetime.utcnow(),
         owner_id=user_id,
@@ -74,12 +74,13 @@ async def get_exchanges_by_token(
         The list of exchanges.
     """
     stmt = (
-        select(User)
+        select(Exchange)
+        .join(User, Exchange.owner_id == User.id)
         .where(
-            User.public_id == user_info.public_id
-            and User.exchanges.any(Exchange.is_active == is_active)
+            User.public_id == user_info.public_id,
+            Exchange.is_active == is_active,
         )
-        .options(selectinload(User.exchanges))
+        .execution_options(yield_per=200)
     )
-    user_obj: User = await db.scalar(stmt)
-    return user_obj.exchanges
+    result = await db.stream_scalars(stmt)
+    return [exchange async for exchange in result]
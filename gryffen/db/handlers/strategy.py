@@ -16,30 +16,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any
+from typing import Dict
 from typing import List
 from fastapi import HTTPException
 from fastapi import status
 from datetime import datetime
 from sqlalchemy import select, update
-from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from gryffen.db.models.users import User
 from gryffen.db.models.strategies import Strategy
 from gryffen.web.api.v1.strategy.schema import StrategyCreationSchema
 from gryffen.security import TokenBase
-from gryffen.web.lifetime import global_listener
+from gryffen.web.lifetime import get_listener
 
 
 async def create_strategy(
     user_id: User.id,
-    submission: StrategyCreationSchema,
+    submission: Dict[str, Any],
     db: AsyncSession,
 ) -> Strategy:
     """Creates a new strategy.
 
     Args:
         user_id: The owner ID whom the strategy belongs to.
-        submission: The Strategy creation schema.
+        submission: The strategy data, dumped once from the creation schema.
         db: The database session object.
 
     Returns:
@@ -47,14 +48,14 @@ async def create_strategy(
     """
 
     strategy = Strategy(
-        name=submission.name,
-        description=submission.description,
-        symbol=submission.symbol,
-        risk_level=submission.risk_level,
-        risk_tolerance=submission.risk_tolerance,
-        principal_balance=submission.principal_balance,
-        max_drawdown=submission.max_drawdown,
-        is_active=submission.is_active,
+        name=submission["name"],
+        description=submission["description"],
+        symbol=submission["symbol"],
+        risk_level=submission["risk_level"],
+        risk_tolerance=submission["risk_tolerance"],
+        principal_balance=submission["principal_balance"],
+        max_drawdown=submission["max_drawdown"],
+        is_active=submission["is_active"],
         timestamp_created=datetime.utcnow(),
         timestamp_updated=datetime.utcnow(),
         owner_id=user_id,
@@ -64,7 +65,7 @@ async def create_strategy(
     await db.commit()
     await db.refresh(strategy)
 
-    await global_listener.subscribe(strategy=strategy)
+    await get_listener().subscribe(strategy=strategy)
 
     return strategy
 
@@ -85,17 +86,16 @@ async def get_strategies_by_token(
         List of strategy objects.
     """
     stmt = (
-        select(User)
+        select(Strategy)
+        .join(User, Strategy.owner_id == User.id)
         .where(
-            User.public_id == user_info.public_id
-            and User.strategies.any(Strategy.is_active == is_active),
-        )
-        .options(
-            selectinload(User.strategies),
+            User.public_id == user_info.public_id,
+            Strategy.is_active == is_active,
         )
+        .execution_options(yield_per=200)
     )
-    user_obj: User = await db.scalar(stmt)
-    return user_obj.strategies
+    result = await db.stream_scalars(stmt)
+    return [strategy async for strategy in result]
 
 
 async def get_strategy_by_id(
@@ -165,23 +165,33 @@ async def update_strategy(
 
 
 async def deactivate_strategy(
-    user_id: User.id,
+    user_info: TokenBase,
     strategy_id: Strategy.id,
     db: AsyncSession,
 ) -> Strategy:
     """Deactivates a strategy.
 
+    The owner check runs inside the UPDATE as a scalar subquery on the
+    user's public_id, so no separate user lookup round-trip is needed.
+    MySQL has no `UPDATE ... RETURNING`, so the updated row is read back
+    with a single follow-up SELECT.
+
     Args:
-        user_id: The owner ID.
+        user_info: The TokenBase object which contains user info.
         strategy_id: The ID of the strategy.
         db: The database session object.
 
     Returns:
         The Strategy object.
     """
+    owner_id = (
+        select(User.id)
+        .where(User.public_id == user_info.public_id)
+        .scalar_subquery()
+    )
     stmt = (
         update(Strategy)
-        .where(Strategy.id == strategy_id and Strategy.owner_id == user_id)
+        .where(Strategy.id == strategy_id, Strategy.owner_id == owner_id)
         .values(is_active=False)
     )
     await db.execute(stmt)
@@ -190,6 +200,6 @@ async def deactivate_strategy(
     strategy = await get_strategy_by_id(strategy_id, db)
 
     # Unsubscribe the symbol of the strategy to global listener.
-    await global_listener.unsubscribe(strategy.symbol)
+    await get_listener().unsubscribe(strategy.symbol)
 
     return strategy
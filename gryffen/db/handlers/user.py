@@ -20,6 +20,7 @@ import uuid
 import jwt
 from typing import Dict
 from typing import Optional
+from typing import Tuple
 from datetime import datetime
 from datetime import timedelta
 from fastapi import Depends
@@ -28,11 +29,12 @@ from fastapi import security
 from fastapi import status
 from sqlalchemy import select
 from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from gryffen.core.google.storage import Storage
 from gryffen.db.models.users import User
+from gryffen.db.models.activations import Activation
 from gryffen.db.dependencies import get_db_session
-from gryffen.db.handlers.activation import verify_activation_code
 from gryffen.web.api.v1.user.schema import UserCreationSchema
 from gryffen.web.api.v1.user.schema import UserAuthenticationSchema
 from gryffen.settings import settings
@@ -80,6 +82,70 @@ async def create_user(
     return user
 
 
+async def register_user(
+    submission: UserCreationSchema,
+    db: AsyncSession,
+) -> Tuple[User, str]:
+    """Creates a user and their activation code in one transaction.
+
+    The user row is flushed — not committed — so its ID is available for
+    the activation row, and both inserts share a single commit. Compared
+    with calling `create_user` and `create_activation_code` back to back
+    this saves one commit and two refresh round-trips per registration.
+
+    Duplicate emails surface as the unique-index violation on the flush,
+    so no separate existence SELECT is needed and two concurrent signups
+    on the same email cannot both pass a pre-check.
+
+    Args:
+        submission: The user creation schema.
+        db: The database session object.
+
+    Returns:
+        Tuple of the newly created user object and the activation code.
+
+    Raises:
+        HTTPException: If the email has already been registered.
+    """
+    user = User(
+        email=submission.email,
+        password=submission.password,
+        username=submission.email,
+        public_id=str(uuid.uuid4()),
+        register_via=submission.register_via,
+        external_uid=submission.external_uid,
+        timestamp_created=datetime.utcnow(),
+        timestamp_updated=datetime.utcnow(),
+    )
+    db.add(user)
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"User email {submission.email} has already been registered."
+        )
+
+    tb = TokenBase(email=user.email, public_id=user.public_id)
+    code = tb.tokenize()
+    db.add(
+        Activation(
+            activation_code=code,
+            is_active=True,
+            timestamp_created=datetime.utcnow(),
+            owner_id=user.id,
+        )
+    )
+    await db.commit()
+
+    storage = Storage(bucket_name=submission.email)
+    await storage.init_storage()
+
+    logger.info(f"[{datetime.utcnow()}] User {user.username} created successfully.")
+    return user, code
+
+
 async def check_user_exist(
     email: str,
     db: AsyncSession
@@ -195,6 +261,26 @@ async def get_user_by_token(
     return None
 
 
+async def get_user_id_by_token(
+    user_info: TokenBase,
+    db: AsyncSession
+) -> Optional[int]:
+    """Fetches the user's internal ID by token.
+
+    Selects only the `id` column, so handlers that need nothing but the
+    owner ID (e.g. the create endpoints) avoid loading a full user row.
+
+    Args:
+        user_info: The current user object.
+        db: The database session.
+
+    Returns:
+        int: The internal user ID, or None if the user is not found.
+    """
+    stmt = select(User.id).where(User.public_id == user_info.public_id)
+    return await db.scalar(stmt)
+
+
 async def get_user_by_email(
     user_email: str,
     db: AsyncSession
@@ -238,9 +324,18 @@ async def activate_user(
     Returns:
         Tuple: Tuple of username, email and access token.
     """
-    tb: TokenBase = await verify_activation_code(activation_code, db)
+    # The signature and expiry checks are local JWT work; the single
+    # SELECT below both confirms the code exists and loads the user, where
+    # previously the activation row and the user were fetched separately.
+    tb = TokenBase(token=activation_code)
+    tb.detokenize()
     usr: User = await db.scalar(
-        select(User).where(User.public_id == tb.public_id),
+        select(User)
+        .join(Activation, Activation.owner_id == User.id)
+        .where(
+            Activation.activation_code == activation_code,
+            User.public_id == tb.public_id,
+        ),
     )
 
     if usr:
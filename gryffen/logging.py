@@ -59,8 +59,23 @@ class InterceptHandler(logging.Handler):
         )
 
 
+# Guards against repeated configuration; get_app() may run several times
+# in one process (test fixtures), and each pass would re-install handlers.
+_configured = False
+
+
 def configure_logging() -> None:  # pragma: no cover
-    """Configures logging."""
+    """Configures logging.
+
+    Idempotent; the loguru sink writes through a background queue
+    (``enqueue=True``) so log records never block the event loop on
+    stdout I/O.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
     intercept_handler = InterceptHandler()
 
     logging.basicConfig(handlers=[intercept_handler], level=logging.NOTSET)
@@ -78,4 +93,5 @@ def configure_logging() -> None:  # pragma: no cover
     logger.add(
         sys.stdout,
         level=settings.log_level.value,
+        enqueue=True,
     )
@@ -27,6 +27,7 @@ import os
 import jwt
 import hashlib
 import binascii
+from functools import lru_cache
 from jwt import PyJWTError
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status
@@ -159,12 +160,15 @@ class TokenBase(BaseModel):
             raise credential_exception
 
 
-def destruct_token(token: str) -> TokenBase:
-    """Decodes token string into TokenBase class object.
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> TokenBase:
+    """Decodes a token string and caches the result per token.
 
     Notes:
-        This is a helper function for the `TokenBase.detokenize()` class method to
-        be used as the dependency injection.
+        Decoding a JWT costs an HMAC verification, and the same bearer token
+        is typically presented on every request of a session, so the decoded
+        TokenBase is memoized keyed on the raw token string. Failed decodes
+        raise and are therefore never cached.
 
     Returns:
         TokenBase: The TokenBase class object, which contains user's info:
@@ -175,3 +179,28 @@ def destruct_token(token: str) -> TokenBase:
     token_base.token = token
     token_base.detokenize()
     return token_base
+
+
+async def destruct_token(token: str) -> TokenBase:
+    """Decodes token string into TokenBase class object.
+
+    Notes:
+        This is a helper function for the `TokenBase.detokenize()` class method to
+        be used as the dependency injection. The decode itself is cached; the
+        expiration is re-checked on every call so a cached token still expires
+        on time.
+
+    Returns:
+        TokenBase: The TokenBase class object, which contains user's info:
+            - email
+            - public_id
+    """
+    token_base = _decode_token(token)
+    if token_base.expiration and token_base.expiration < datetime.utcnow():
+        logger.error("Invalid credential - Token expired.")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Credential invalid, make sure you have the valid credential.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token_base
@@ -85,6 +85,8 @@ class Settings(BaseSettings):
     db_pass: str = os.getenv("DB_PASS")
     db_base: str = os.getenv("DB_NAME")
     db_echo: bool = False
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", 20))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
 
     # Finnhub
     finnhub_ws_endpoint: str = os.getenv("FINNHUB_WEBSOCKET_URI")
@@ -98,8 +100,14 @@ class Settings(BaseSettings):
     td_ameritrade_orders_endpoint: str = os.getenv("TD_API_ORDERS_URL")
     td_ameritrade_redirect_uri: str = os.getenv("TD_API_REDIRECT_URL")
 
+    # Peer IPs allowed onto the private routes; comma-separated. Distinct
+    # from FRONT_END_BASE_URL, which is a URL used to build links and can
+    # never match request.client.host. Leaving this unset disables the
+    # check, matching the behaviour before the private routes enforced it.
     front_end_ip_address: list = [
-        os.getenv("FRONT_END_BASE_URL"),
+        ip.strip()
+        for ip in os.getenv("FRONT_END_IP_ADDRESS", "").split(",")
+        if ip.strip()
     ]
 
     @property
@@ -25,6 +25,7 @@ from gryffen.web.api.v1 import credential
 
 router = APIRouter()
 router.include_router(user.router, prefix="/v1", tags=["user"])
+router.include_router(user.private_router, prefix="/v1", tags=["user"])
 router.include_router(strategy.router, prefix="/v1", tags=["strategy"])
 router.include_router(exchange.router, prefix="/v1", tags=["exchange"])
 router.include_router(credential.router, prefix="/v1", tags=["credential"])
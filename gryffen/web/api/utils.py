@@ -20,48 +20,145 @@ import re
 import os
 import json
 import base64
+import orjson
+from decimal import Decimal
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from typing import Any
 from dotenv import load_dotenv
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from fastapi import Request
 from fastapi import HTTPException
+from fastapi import Response
 from fastapi import status
-from gryffen.settings import Settings
+from sqlalchemy import inspect as sqlalchemy_inspect
+from gryffen.db.base import SENSITIVE_COLUMNS
+from gryffen.settings import settings
 
 
 load_dotenv()
 
+# Email validation regex pattern, compiled once at import time so every
+# call to `is_valid_email` reuses the same pattern object.
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
+def _default(obj: Any) -> Any:
+    """Fallback serializer for types orjson does not handle natively.
+
+    Args:
+        obj: The object orjson could not serialize on its own.
+
+    Returns:
+        A JSON-serializable representation of the object; SQLAlchemy model
+            instances are flattened to a plain column-value dict.
+
+    Raises:
+        TypeError: If the object is of an unsupported type.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, bytes):
+        # Binary columns (e.g. hashed passwords) are ASCII hex, but decode
+        # defensively so an odd byte can never take down a response.
+        return obj.decode("utf-8", errors="replace")
+    inspected = sqlalchemy_inspect(obj, raiseerr=False)
+    if inspected is not None and hasattr(inspected, "mapper"):
+        # Credential columns are dropped rather than serialized: the
+        # password hash and API key must never be echoed to a client.
+        return {
+            attr.key: getattr(obj, attr.key)
+            for attr in inspected.mapper.column_attrs
+            if attr.key not in SENSITIVE_COLUMNS
+        }
+    raise TypeError(f"Type {type(obj)} is not serializable")
+
+
+def orjson_dumps(content: Any) -> bytes:
+    """Serializes content to JSON bytes with the shared orjson options.
+
+    Args:
+        content: The object to serialize.
+
+    Returns:
+        The serialized JSON bytes.
+    """
+    return orjson.dumps(
+        content,
+        default=_default,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+class ORJSONResponse(Response):
+
+    """A Response class that serializes content with orjson.
+
+    Unlike the default `JSONResponse`, this class does not require the
+    content to be pre-processed by `jsonable_encoder`; orjson serializes
+    datetimes and UUIDs natively and `_default` takes care of SQLAlchemy
+    model instances, so each response is rendered in a single pass.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
+
+
+async def verify_private(request: Request) -> None:
+    """Router-level dependency that restricts a route to the front end.
+
+    Replaces the old `private_method` decorator; FastAPI resolves it once
+    per request through the dependency graph instead of adding a wrapper
+    frame around every handler call.
+
+    Args:
+        request: The incoming request object.
+
+    Raises:
+        HTTPException: If allowed IPs are configured and the client IP
+            is not one of them.
+    """
+    allowed = settings.front_end_ip_address
+    if not allowed:
+        # No FRONT_END_IP_ADDRESS configured; keep the routes open as
+        # they were before this check was enforced.
+        return
+    if request.client.host not in allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied."
+        )
 
-def private_method(func):
 
-    async def wrapper(request: Request, *args, **kwargs):
-        client_ip = request.client.host
-        if client_ip in Settings.front_end_ip_address:
-            return func(*args, **kwargs)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied."
-            )
+async def get_mail_service(request: Request) -> "GriffinMailService":
+    """Dependency that returns the shared mail service instance.
 
-    return wrapper
+    The service is built on first use and cached on `app.state`, so the
+    service-account credential exchange happens once per process but is
+    never required just to boot — environments without mail credentials
+    keep working until something actually sends mail.
 
+    Args:
+        request: The incoming request object.
 
-def is_valid_email(email):
-    # Email validation regex pattern
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    Returns:
+        The application-wide GriffinMailService instance.
+    """
+    service = getattr(request.app.state, "mail_service", None)
+    if service is None:
+        service = GriffinMailService()
+        request.app.state.mail_service = service
+    return service
 
-    # Use the regex pattern to search for a match in the email string
-    match = re.match(pattern, email)
 
-    # If match is found, return True, else return False
-    if match:
-        return True
-    else:
-        return False
+def is_valid_email(email):
+    # Use the pre-compiled regex pattern to search for a match in the
+    # email string; if a match is found, return True, else return False
+    return _EMAIL_RE.match(email) is not None
 
 
 class GriffinMailService:
@@ -34,6 +34,8 @@ class CredentialCreationSchema(BaseModel):
         expires_at (datetime): The expiration date
     """
 
+    # Not strict: strict datetime validation refuses the ISO-8601 strings
+    # that are the only way JSON can carry `expires_at`.
     model_config = ConfigDict(from_attributes=True)
 
     exchange_id: int
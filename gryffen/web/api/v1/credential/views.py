@@ -23,89 +23,19 @@ Author: Thomas Lin (ithomaslin@gmail.com | thomas@neat.tw)
 Date: 22/04/2023
 """
 
-from fastapi import APIRouter
-from fastapi import Depends
-from fastapi import status
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
-from gryffen.db.dependencies import get_db_session
-from gryffen.db.models.users import User
-from gryffen.db.models.credentials import Credential
-from gryffen.db.handlers.user import get_user_by_token
 from gryffen.db.handlers.credential import create_credential
 from gryffen.db.handlers.credential import get_credentials_by_token
-from gryffen.security import destruct_token
-from gryffen.security import TokenBase
 from gryffen.web.api.v1.credential.schema import CredentialCreationSchema
-
-
-router = APIRouter(prefix="/credential")
-
-
-@router.get("/")
-async def get(
-    user_info: TokenBase = Depends(destruct_token),
-    db: AsyncSession = Depends(get_db_session),
-    status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
-    """Gets all the credentials associated with a user.
-
-    Args:
-        user_info: The decoded access token as the TokenBase object.
-        db: The database session object, which will be populated by the dependency injection
-            method `get_db_session` automatically.
-        status_code: The default status_code to be returned when the request is successful.
-
-    Returns:
-        The JSONResponse of the credential objects
-    """
-    credentials: List[Credential] = await get_credentials_by_token(user_info, db)
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": "success",
-            "message": "Credentials retrieved successfully.",
-            "data": {
-                "credentials": jsonable_encoder(credentials)
-            }
-        }
-    )
-
-
-@router.post("/")
-async def create(
-    request: CredentialCreationSchema,
-    user_info: TokenBase = Depends(destruct_token),
-    db: AsyncSession = Depends(get_db_session),
-    status_code: int = status.HTTP_201_CREATED,
-) -> JSONResponse:
-    """Creates a new credential entry and link to an existing exchange.
-
-    Args:
-        request: The Credential creation schema.
-        user_info: The decoded access token as the TokenBase object.
-        db: The database session object, which will be populated by the dependency injection
-            method `get_db_session` automatically.
-        status_code: The default status_code to be returned when the request is successful.
-
-    Returns:
-        The JSONResponse of the credential object that's just created.
-    """
-    usr: User = await get_user_by_token(user_info, db)
-    credential = await create_credential(
-        user_id=usr.id,
-        submission=request,
-        db=db
-    )
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": "success",
-            "message": "Credential created successfully.",
-            "data": {
-                "credential": jsonable_encoder(credential)
-            }
-        }
-    )
+from gryffen.web.api.v1.factory import make_crud_router
+
+
+router = make_crud_router(
+    prefix="/credential",
+    singular="credential",
+    plural="credentials",
+    schema=CredentialCreationSchema,
+    get_fn=get_credentials_by_token,
+    create_fn=create_credential,
+    fetch_message="Credentials retrieved successfully.",
+    create_message="Credential created successfully.",
+)
@@ -30,7 +30,7 @@ class ExchangeCreationSchema(BaseModel):
         account_id (str): Account id of the exchange.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, strict=True)
 
     name: str
     type: str
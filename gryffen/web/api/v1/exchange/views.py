@@ -23,95 +23,19 @@ Author: Thomas Lin (ithomaslin@gmail.com | thomas@neat.tw)
 Date: 22/04/2023
 """
 
-from typing import List
-from fastapi import APIRouter
-from fastapi import Depends
-from fastapi import status
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from gryffen.db.dependencies import get_db_session
 from gryffen.db.handlers.exchange import create_exchange
 from gryffen.db.handlers.exchange import get_exchanges_by_token
-from gryffen.db.handlers.user import get_user_by_token
-from gryffen.db.models.exchanges import Exchange
-from gryffen.db.models.users import User
-from gryffen.security import destruct_token
-from gryffen.security import TokenBase
 from gryffen.web.api.v1.exchange.schema import ExchangeCreationSchema
-
-
-# Setting the API router prefix to `/exchange`
-router = APIRouter(prefix="/exchange")
-
-
-@router.get("/")
-async def get(
-    user_info: TokenBase = Depends(destruct_token),
-    db: AsyncSession = Depends(get_db_session),
-    status_code: int = status.HTTP_200_OK
-) -> JSONResponse:
-    """Fetches all exchange brokers.
-
-    Retrieves all exchange brokers for a given user by access token.
-
-    Args:
-        user_info: The decoded access token as the TokenBase object.
-        db: The database session object, which will be populated by the dependency injection
-            method `get_db_session` automatically.
-        status_code: The default status_code to be returned when the request is successful.
-
-    Returns:
-        JSONResponse: The json object with all the exchanges' info.
-    """
-    exchanges: List[Exchange] = await get_exchanges_by_token(user_info, db)
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": "success",
-            "message": "Exchanges fetched successfully.",
-            "data": {
-                "exchanges": jsonable_encoder(exchanges)
-            }
-        }
-    )
-
-
-@router.post("/")
-async def create(
-    request: ExchangeCreationSchema,
-    user_info: TokenBase = Depends(destruct_token),
-    db: AsyncSession = Depends(get_db_session),
-    status_code: int = status.HTTP_201_CREATED,
-) -> JSONResponse:
-    """Creates an exchange broker.
-
-    Creates an exchange broker for a given user by access token.
-
-    Args:
-        request: The exchange creation schema.
-        user_info: The decoded access token as the TokenBase object.
-        db: The database session object, which will be populated by the dependency injection
-            method `get_db_session` automatically.
-        status_code: The default status_code to be returned when the request is successful.
-
-    Returns:
-        JSONResponse: The json object with the created exchange's info.
-    """
-    usr: User = await get_user_by_token(user_info, db)
-    exchange: Exchange = await create_exchange(
-        user_id=usr.id,
-        submission=request,
-        db=db
-    )
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": "success",
-            "message": "Exchange created successfully.",
-            "data": {
-                "exchange": jsonable_encoder(exchange)
-            }
-        }
-    )
+from gryffen.web.api.v1.factory import make_crud_router
+
+
+router = make_crud_router(
+    prefix="/exchange",
+    singular="exchange",
+    plural="exchanges",
+    schema=ExchangeCreationSchema,
+    get_fn=get_exchanges_by_token,
+    create_fn=create_exchange,
+    fetch_message="Exchanges fetched successfully.",
+    create_message="Exchange created successfully.",
+)
@@ -0,0 +1,155 @@
+# Copyright (c) 2023, TradingLab
+# All rights reserved.
+#
+# This file is part of TradingLab.app
+# See https://tradinglab.app for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This script provides the factory that builds the resource CRUD routers.
+
+Author: Thomas Lin (ithomaslin@gmail.com | thomas@neat.tw)
+"""
+
+from typing import Awaitable
+from typing import Callable
+from typing import List
+from typing import Type
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import Response
+from fastapi import status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from gryffen.db.base import Base
+from gryffen.db.dependencies import get_db_session
+from gryffen.db.handlers.user import get_user_id_by_token
+from gryffen.security import destruct_token
+from gryffen.security import TokenBase
+from gryffen.web.api.utils import ORJSONResponse
+from gryffen.web.api.utils import orjson_dumps
+
+
+def make_crud_router(
+    prefix: str,
+    singular: str,
+    plural: str,
+    schema: Type[BaseModel],
+    get_fn: Callable[[TokenBase, AsyncSession], Awaitable[List[Base]]],
+    create_fn: Callable[..., Awaitable[Base]],
+    fetch_message: str,
+    create_message: str,
+    create_path: str = "/",
+    create_status_code: int = status.HTTP_201_CREATED,
+) -> APIRouter:
+    """Builds the list/create router shared by the resource endpoints.
+
+    The credential, exchange, and strategy routers are structurally
+    identical wrappers around their DB handlers; generating them from one
+    site keeps the envelope pre-encoding, the orjson serialization, and
+    the scalar user-ID lookup uniform, and routers that need extra routes
+    (e.g. strategy's deactivate) add them onto the returned router.
+
+    Args:
+        prefix: The URL prefix for the router, e.g. `/credential`.
+        singular: The data key used for a single object in responses.
+        plural: The data key used for the object list in responses.
+        schema: The Pydantic creation schema for the POST endpoint.
+        get_fn: The DB handler that lists the user's objects by token.
+        create_fn: The DB handler that creates an object for a user.
+        fetch_message: The response message for the list endpoint.
+        create_message: The response message for the create endpoint.
+        create_path: The path of the create endpoint.
+        create_status_code: The default status code for the create endpoint.
+
+    Returns:
+        The configured APIRouter.
+    """
+    router = APIRouter(prefix=prefix)
+
+    # Static JSON envelope for the list endpoint, pre-encoded once per
+    # router so each response only serializes the variable rows.
+    list_prefix = (
+        f'{{"status":"success","message":"{fetch_message}","data":{{"{plural}":'
+    ).encode()
+    list_suffix = b"}}"
+
+    @router.get("/", response_model=None)
+    async def get(
+        user_info: TokenBase = Depends(destruct_token),
+        db: AsyncSession = Depends(get_db_session),
+        status_code: int = status.HTTP_200_OK,
+    ) -> Response:
+        """Gets all the objects of this resource associated with a user.
+
+        Args:
+            user_info: The decoded access token as the TokenBase object.
+            db: The database session object, which will be populated by the
+                dependency injection method `get_db_session` automatically.
+            status_code: The default status_code to be returned when the
+                request is successful.
+
+        Returns:
+            The JSON response with the user's objects.
+        """
+        rows = await get_fn(user_info, db)
+        body = (
+            list_prefix
+            + orjson_dumps([row.to_dict() for row in rows])
+            + list_suffix
+        )
+        return Response(
+            content=body,
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+    @router.post(create_path, response_model=None)
+    async def create(
+        request: schema,
+        user_info: TokenBase = Depends(destruct_token),
+        db: AsyncSession = Depends(get_db_session),
+        status_code: int = create_status_code,
+    ) -> ORJSONResponse:
+        """Creates a new object of this resource for a user.
+
+        Args:
+            request: The creation schema of this resource.
+            user_info: The decoded access token as the TokenBase object.
+            db: The database session object, which will be populated by the
+                dependency injection method `get_db_session` automatically.
+            status_code: The default status_code to be returned when the
+                request is successful.
+
+        Returns:
+            The ORJSONResponse with the object that's just created.
+        """
+        user_id: int = await get_user_id_by_token(user_info, db)
+        row = await create_fn(
+            user_id=user_id,
+            submission=request.model_dump(),
+            db=db,
+        )
+        return ORJSONResponse(
+            status_code=status_code,
+            content={
+                "status": "success",
+                "message": create_message,
+                "data": {
+                    singular: row.to_dict()
+                }
+            }
+        )
+
+    return router
@@ -38,7 +38,7 @@ class StrategyCreationSchema(BaseModel):
         is_active (bool): Whether the strategy is active.
     """
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, strict=True)
 
     name: str
     description: str
@@ -23,102 +23,41 @@ Author: Thomas Lin (ithomaslin@gmail.com | thomas@neat.tw)
 Date: 22/04/2023
 """
 
-from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import status
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
 from gryffen.db.dependencies import get_db_session
-from gryffen.db.models.users import User
-from gryffen.db.models.strategies import Strategy
-from gryffen.db.handlers.user import get_user_by_token
 from gryffen.db.handlers.strategy import get_strategies_by_token
 from gryffen.db.handlers.strategy import create_strategy
 from gryffen.db.handlers.strategy import deactivate_strategy
+from gryffen.web.api.utils import ORJSONResponse
+from gryffen.web.api.v1.factory import make_crud_router
 from gryffen.web.api.v1.strategy.schema import StrategyCreationSchema
 from gryffen.security import destruct_token
 from gryffen.security import TokenBase
 
 
-router = APIRouter(prefix="/strategy")
+router = make_crud_router(
+    prefix="/strategy",
+    singular="strategy",
+    plural="strategies",
+    schema=StrategyCreationSchema,
+    get_fn=get_strategies_by_token,
+    create_fn=create_strategy,
+    fetch_message="Fetches all strategies successfully.",
+    create_message="Strategy created.",
+    create_path="/create",
+    create_status_code=status.HTTP_200_OK,
+)
 
 
-@router.get("/")
-async def get(
-    user_info: TokenBase = Depends(destruct_token),
-    db: AsyncSession = Depends(get_db_session),
-    status_code: int = status.HTTP_200_OK
-) -> JSONResponse:
-    """Gets all strategies of a user.
-
-    Args:
-        user_info: The decoded access token as the TokenBase object.
-        db: The database session object, which will be populated by the dependency injection
-            method `get_db_session` automatically.
-        status_code: The default status_code to be returned when the request is successful.
-
-    Returns:
-        The JSOResponse of all strategies under a user.
-    """
-    strategies: List[Strategy] = await get_strategies_by_token(user_info, db)
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": "success",
-            "message": "Fetches all strategies successfully.",
-            "data": {
-                "strategies": jsonable_encoder(strategies)
-            }
-        }
-    )
-
-
-@router.post("/create")
-async def create(
-    request: StrategyCreationSchema,
-    user_info: TokenBase = Depends(destruct_token),
-    db: AsyncSession = Depends(get_db_session),
-    status_code: int = status.HTTP_200_OK
-) -> JSONResponse:
-    """Creates a new strategy for a user.
-
-    Args:
-        request: The strategy creation schema.
-        user_info: The decoded access token as the TokenBase object.
-        db: The database session object, which will be populated by the dependency injection
-            method `get_db_session` automatically.
-        status_code: The default status_code to be returned when the request is successful.
-
-    Returns:
-        JSONResponse of strategy object just created.
-    """
-    usr: User = await get_user_by_token(user_info=user_info, db=db)
-    strategy = await create_strategy(
-        user_id=usr.id,
-        submission=request,
-        db=db,
-    )
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "status": "success",
-            "message": "Strategy created.",
-            "data": {
-                "strategy": jsonable_encoder(strategy)
-            }
-        }
-    )
-
-
-@router.put("/deactivate/{strategy_id}")
+@router.put("/deactivate/{strategy_id}", response_model=None)
 async def deactivate(
     strategy_id: int,
     user_info: TokenBase = Depends(destruct_token),
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Deactivates a strategy by its ID.
 
     Args:
@@ -129,17 +68,16 @@ async def deactivate(
         status_code: The default status_code to be returned when the request is successful.
 
     Returns:
-        JSONResponse of strategy object that's just disabled.
+        ORJSONResponse of strategy object that's just disabled.
     """
-    usr: User = await get_user_by_token(user_info=user_info, db=db)
-    strategy = await deactivate_strategy(usr.id, strategy_id, db)
-    return JSONResponse(
+    strategy = await deactivate_strategy(user_info, strategy_id, db)
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
             "message": f"Successfully disabling strategy with ID: {strategy.id}",
             "data": {
-                "strategy": strategy
+                "strategy": strategy.to_dict()
             }
         }
     )
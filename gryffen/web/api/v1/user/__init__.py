@@ -16,6 +16,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from gryffen.web.api.v1.user.views import private_router
 from gryffen.web.api.v1.user.views import router
 
-__all__ = ["router"]
+__all__ = ["private_router", "router"]
@@ -16,37 +16,71 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+from typing import Annotated
 from typing import List
+from typing import Tuple
 from pydantic import BaseModel
-from pydantic import EmailStr
+from pydantic import BeforeValidator
 from pydantic import ConfigDict
 from gryffen.web.api.utils import is_valid_email
 
 
+def _validate_email(value: str) -> str:
+    # Strip here as well: a BeforeValidator runs ahead of the model's
+    # str_strip_whitespace handling.
+    value = value.strip()
+    if not is_valid_email(value):
+        raise ValueError("value is not a valid email address")
+    # Lowercase so the email always hits the same DB index entry, and
+    # intern so repeated lookups on the same address within a request
+    # compare by pointer instead of character-by-character.
+    return sys.intern(value.lower())
+
+
+# Email type backed by the module-level pre-compiled pattern; one regex
+# match per validation instead of email-validator's multi-pass parse.
+Email = Annotated[str, BeforeValidator(_validate_email)]
+
+
 class UserCreationSchema(BaseModel):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        str_strip_whitespace=True,
+        extra="forbid",
+    )
 
-    email: EmailStr
+    email: Email
     password: str
     register_via: str
     external_uid: bool
-    # In-class list to capture validation errors
-    __errors: List = []
 
-    async def is_valid(self):
-        if not self.email or not is_valid_email(self.email):
-            self.__errors.append("Please enter a valid email address.")
+    def is_valid(self) -> Tuple[bool, List[str]]:
+        """Validates the submission and collects the error messages.
+
+        The errors are collected in a local list; the previous class-level
+        list was shared by every instance and grew for the lifetime of the
+        process. The checks are pure string work, so this is a plain
+        function rather than a coroutine.
 
-        if not self.__errors:
-            return True
-        return False
+        Returns:
+            Tuple of whether the submission is valid and the error messages.
+        """
+        errors: List[str] = []
+        if not self.email or not is_valid_email(self.email):
+            errors.append("Please enter a valid email address.")
+        return not errors, errors
 
 
 class UserAuthenticationSchema(BaseModel):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        str_strip_whitespace=True,
+        extra="forbid",
+    )
 
-    email: str
+    email: Email
     password: str
     external_uid: bool
@@ -23,22 +23,26 @@ Author: Thomas Lin (ithomaslin@gmail.com | thomas@neat.tw)
 Date: 22/04/2023
 """
 
+import hashlib
+import time
+from typing import Any
+from typing import Dict
+from typing import Tuple
 from fastapi import APIRouter
+from fastapi import BackgroundTasks
 from fastapi import Depends
 from fastapi import Form
 from fastapi import HTTPException
+from fastapi import Response
 from fastapi import status
 from fastapi import security
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 from gryffen.db.dependencies import get_db_session
-from gryffen.db.handlers.activation import create_activation_code
 from gryffen.db.handlers.activation import reissue_activation_code
 from gryffen.db.handlers.user import authenticate_user
 from gryffen.db.handlers.user import activate_user
 from gryffen.db.handlers.user import check_user_exist
-from gryffen.db.handlers.user import create_user
+from gryffen.db.handlers.user import register_user
 from gryffen.db.handlers.user import get_user_by_token
 from gryffen.db.handlers.user import promote_user
 from gryffen.db.handlers.user import create_new_api_key
@@ -50,18 +54,71 @@ from gryffen.db.models.users import User
 from gryffen.web.api.v1.user.schema import UserCreationSchema
 from gryffen.web.api.v1.user.schema import UserAuthenticationSchema
 from gryffen.web.api.utils import GriffinMailService
-from gryffen.web.api.utils import private_method
+from gryffen.web.api.utils import get_mail_service
+from gryffen.web.api.utils import ORJSONResponse
+from gryffen.web.api.utils import orjson_dumps
+from gryffen.web.api.utils import verify_private
 from gryffen.security import destruct_token
 from gryffen.security import TokenBase
 
 
-router = APIRouter(prefix="/user")
+router = APIRouter(prefix="/user", default_response_class=ORJSONResponse)
+
+# Front-end-only routes; the IP check runs once per request as a router
+# dependency instead of a per-handler wrapper.
+private_router = APIRouter(
+    prefix="/user",
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(verify_private)],
+)
+
+# Static pieces of the registration success payload, hoisted so the two
+# register handlers don't rebuild the same strings per request.
+# has-account lives on the IP-restricted private_router, but the front
+# end polls it during signup, so its answers are held for a short TTL to
+# avoid turning every keystroke-triggered call into a DB query.
+# Keyed by lowercased email; wiped wholesale when it grows too large.
+_EXISTS_CACHE_TTL = 60.0
+_EXISTS_CACHE_MAX = 10_000
+_exists_cache: Dict[str, Tuple[float, bool]] = {}
+
+# Clients that re-mount or resume tend to replay the same refresh token
+# in quick succession; each replay minted a fresh token pair through a DB
+# verify. Hold the minted pair briefly, keyed by a hash of the refresh
+# token so the raw token never sits in the map.
+_REFRESH_BURST_TTL = 5.0
+_REFRESH_BURST_MAX = 10_000
+_refresh_burst: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+
+# Register channels handled by third-party OAuth; membership is one hash
+# lookup and new providers only need a new entry here.
+_SOCIAL_PROVIDERS = frozenset({"google.com"})
+
+_REGISTER_OK_MESSAGE = "User created."
+_REGISTER_OK_INFO = "Please activate your account within 15 minutes."
+
+# Fully static payloads, encoded once at import; returning them is a plain
+# memcpy instead of a per-request dict build plus JSON encode.
+_REISSUE_OK = orjson_dumps({
+    "status": "success",
+    "message": "Activation code reissued successfully.",
+})
+_PROMOTE_OK = orjson_dumps({
+    "status": "success",
+    "message": "User promoted successfully.",
+})
+_PROMOTE_FAILED = orjson_dumps({
+    "status": "failed",
+    "message": "User promotion failed.",
+})
 
 
 @router.post("/create", include_in_schema=False)
 async def create_user_via_json(
     request: UserCreationSchema,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db_session),
+    mail_service: GriffinMailService = Depends(get_mail_service),
     status_code: int = status.HTTP_201_CREATED,
 ):
     """Creates user (via application/json)
@@ -81,56 +138,49 @@ async def create_user_via_json(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             - status: The status of the request.
             - message: The message of the request.
             - data: The data of the request.
     """
-    valid = await request.is_valid()
-    user_exists = await check_user_exist(request.email, db)
-    if user_exists:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"User email {request.email} has already been registered."
-        )
+    # Cheap local validation first; the DB round-trip only runs for
+    # well-formed submissions.
+    valid, errors = request.is_valid()
     if not valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid input."
+            detail=" ".join(errors)
         )
 
-    user: User = await create_user(request, db)
-    activation_code: str = await create_activation_code(
-        user.public_id, user.id, user.email, db
-    )
+    user, activation_code = await register_user(request, db)
+    _exists_cache[user.email] = (time.monotonic() + _EXISTS_CACHE_TTL, True)
 
-    service = GriffinMailService()
-    service.send(
-        to=user.email,
-        code=activation_code
-    )
+    # SMTP handshake takes hundreds of milliseconds; send after the
+    # response instead of blocking the handler on it.
+    background_tasks.add_task(mail_service.send, to=user.email, code=activation_code)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
-            "message": "User created.",
+            "message": _REGISTER_OK_MESSAGE,
             "details": {
-                "user": jsonable_encoder(user),
+                "user": user,
                 "activation_code": activation_code,
-                "info": "Please activate your account within 15 minutes."
+                "info": _REGISTER_OK_INFO
             }
         }
     )
 
 
-@private_method
-@router.post("/create/form", include_in_schema=False)
+@private_router.post("/create/form", include_in_schema=False)
 async def create_user_via_form(
+    background_tasks: BackgroundTasks,
     email: str = Form(...),
     password: str = Form(...),
     register_via: str = Form(...),
     db: AsyncSession = Depends(get_db_session),
+    mail_service: GriffinMailService = Depends(get_mail_service),
     status_code: int = status.HTTP_201_CREATED,
 ):
     """Creates user (via Form)
@@ -147,44 +197,42 @@ async def create_user_via_form(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
     """
-    submission = UserCreationSchema(
-        email=email,
+    # The Form fields are already parsed strings; model_construct skips a
+    # second pydantic-core pass and the cheap regex check below keeps the
+    # email-format guard. Normalize the email the same way the schema's
+    # Email validator would, since model_construct bypasses it: mixed-case
+    # submissions must land on the same DB index entry and cache key.
+    submission = UserCreationSchema.model_construct(
+        email=email.strip().lower(),
         password=password,
         register_via=register_via,
         external_uid=False
     )
-    user_exists = await check_user_exist(email, db)
-    if user_exists:
+    valid, errors = submission.is_valid()
+    if not valid:
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Your email {email} has already been registered."
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=" ".join(errors)
         )
+    usr, activation_code = await register_user(submission, db)
+    _exists_cache[usr.email] = (time.monotonic() + _EXISTS_CACHE_TTL, True)
 
-    usr: User = await create_user(submission, db)
-    activation_code: str = await create_activation_code(
-        usr.public_id, usr.id, usr.email, db
-    )
-
-    mail_service = GriffinMailService()
-    mail_service.send(
-        to=usr.email,
-        code=activation_code
-    )
+    background_tasks.add_task(mail_service.send, to=usr.email, code=activation_code)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
-            "message": "User created.",
+            "message": _REGISTER_OK_MESSAGE,
             "details": {
-                "user": jsonable_encoder(usr),
+                "user": usr,
                 "activation_code": activation_code,
-                "info": "Please activate your account within 15 minutes."
+                "info": _REGISTER_OK_INFO
             }
         }
     )
@@ -195,7 +243,7 @@ async def login_for_oauth_token(
     form_data: security.OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Logs user in (via OAuth2PasswordRequestForm)
 
     Authenticates user with email/password pair.
@@ -208,7 +256,7 @@ async def login_for_oauth_token(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
@@ -225,10 +273,10 @@ async def login_for_oauth_token(
             detail=f"User with email {form_data.username} is not found."
         )
 
-    if usr.register_via == 'google.com':
+    if usr.register_via in _SOCIAL_PROVIDERS:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"User is authenticated via Google Login."
+            detail=f"User is authenticated via {usr.register_via}."
         )
 
     if not usr.is_active:
@@ -239,26 +287,25 @@ async def login_for_oauth_token(
 
     token = await oauth_create_token(usr)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
             "message": "User logged in successfully.",
             "details": {
-                "user": jsonable_encoder(usr),
+                "user": usr,
                 "token": token,
             }
         }
     )
 
 
-@private_method
-@router.post("/social-login", include_in_schema=False)
+@private_router.post("/social-login", include_in_schema=False)
 async def social_login(
     request: UserAuthenticationSchema,
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Logs user in (via third-party OAuth)
 
     Authenticates the user via third-party OAuth provider. It will create a new
@@ -274,7 +321,7 @@ async def social_login(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
@@ -301,26 +348,25 @@ async def social_login(
 
     token = await oauth_create_token(usr)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
             "message": "User logged in successfully.",
             "details": {
-                "user": jsonable_encoder(usr),
+                "user": usr,
                 "token": token,
             }
         }
     )
 
 
-@private_method
-@router.get("/oauth-refresh-token", include_in_schema=False)
+@private_router.get("/oauth-refresh-token", include_in_schema=False)
 async def oauth_refresh(
     refresh_token: str,
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Refreshes the access token.
 
     Args:
@@ -331,15 +377,24 @@ async def oauth_refresh(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
                 - token: The access token object.
     """
-    token = await oauth_refresh_token(refresh_token, db)
-
-    return JSONResponse(
+    key = hashlib.sha256(refresh_token.encode()).digest()
+    now = time.monotonic()
+    cached = _refresh_burst.get(key)
+    if cached is not None and cached[0] > now:
+        token = cached[1]
+    else:
+        token = await oauth_refresh_token(refresh_token, db)
+        if len(_refresh_burst) >= _REFRESH_BURST_MAX:
+            _refresh_burst.clear()
+        _refresh_burst[key] = (now + _REFRESH_BURST_TTL, token)
+
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
@@ -356,7 +411,7 @@ async def get_user(
     user_info: TokenBase = Depends(destruct_token),
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Gets user object
 
     Retrieves user's information.
@@ -368,31 +423,30 @@ async def get_user(
         status_code: The default status_code to be returned when the request is successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
                 - user: The user object.
     """
     usr: User = await get_user_by_token(user_info, db)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
             "message": "User fetched successfully.",
             "details": {
-                "user": jsonable_encoder(usr),
+                "user": usr,
             }
         }
     )
 
 
-@private_method
-@router.get("/oauth/me", include_in_schema=False)
+@private_router.get("/oauth/me", include_in_schema=False)
 async def oauth_get_user(
     usr: UserAuthenticationSchema = Depends(oauth_get_current_user),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Gets user object.
 
     Retrieves user's information via OAuth.
@@ -403,31 +457,32 @@ async def oauth_get_user(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
                 |- user: The user object.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
             "message": "User fetched successfully.",
             "details": {
-                "user": jsonable_encoder(usr),
+                "user": usr,
             }
         }
     )
 
 
-@private_method
-@router.get("/reissue-activation-code/{email}", include_in_schema=False)
+@private_router.get("/reissue-activation-code/{email}", include_in_schema=False)
 async def reissue_activation(
     email: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db_session),
+    mail_service: GriffinMailService = Depends(get_mail_service),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Reissues a new activation code
 
     Generates a new activation code for the user and sends it to the user's
@@ -441,33 +496,26 @@ async def reissue_activation(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
     """
     activation_code = await reissue_activation_code(email, db)
-    mail_service = GriffinMailService()
-    mail_service.send(
-        to=email,
-        code=activation_code
-    )
+    background_tasks.add_task(mail_service.send, to=email, code=activation_code)
 
-    return JSONResponse(
+    return Response(
+        content=_REISSUE_OK,
         status_code=status_code,
-        content={
-            "status": "success",
-            "message": "Activation code reissued successfully.",
-        }
+        media_type="application/json",
     )
 
 
-@private_method
-@router.get("/activate/{activation_code}", include_in_schema=False)
+@private_router.get("/activate/{activation_code}", include_in_schema=False)
 async def activate(
     activation_code: str,
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Activates user account
 
     Activates user's account via the activation code.
@@ -484,7 +532,7 @@ async def activate(
             successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
@@ -494,7 +542,7 @@ async def activate(
     """
     email, public_id, access_token = await activate_user(activation_code, db)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
@@ -508,14 +556,13 @@ async def activate(
     )
 
 
-@private_method
-@router.post("/promote/{public_id}", include_in_schema=False)
+@private_router.post("/promote/{public_id}", include_in_schema=False)
 async def promote(
     public_id: str,
     user_info: TokenBase = Depends(destruct_token),
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Promotes a user to superuser.
 
     Promotes a user to superuser with their public ID; only the users who
@@ -532,7 +579,7 @@ async def promote(
             is successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
@@ -541,23 +588,19 @@ async def promote(
     """
     result = await promote_user(user_info, public_id, db)
 
-    return JSONResponse(
+    return Response(
+        content=_PROMOTE_OK if result else _PROMOTE_FAILED,
         status_code=status_code,
-        content={
-            "status": "success" if result else "failed",
-            "message": "User promoted successfully." if result
-            else "User promotion failed.",
-        }
+        media_type="application/json",
     )
 
 
-@private_method
-@router.get("/new-api-key/{email}", include_in_schema=False)
+@private_router.get("/new-api-key/{email}", include_in_schema=False)
 async def generate_api_key(
     email: str,
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Creates new API key.
 
     Args:
@@ -568,7 +611,7 @@ async def generate_api_key(
             is successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
@@ -578,7 +621,7 @@ async def generate_api_key(
     """
     api_key = await create_new_api_key(email, db)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
@@ -590,13 +633,12 @@ async def generate_api_key(
     )
 
 
-@private_method
-@router.get("/has-account/{email}", include_in_schema=False)
+@private_router.get("/has-account/{email}", include_in_schema=False)
 async def has_registered(
     email: str,
     db: AsyncSession = Depends(get_db_session),
     status_code: int = status.HTTP_200_OK,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Checks if a user has registered
 
     Args:
@@ -607,15 +649,24 @@ async def has_registered(
             is successful.
 
     Returns:
-        A JSONResponse object with the following fields:
+        An ORJSONResponse object with the following fields:
             status: The status of the request.
             message: The message of the request.
             data: The data of the request.
                 - status: The status of the request.
                 - message: The message of the request.
     """
-    exists = await check_user_exist(email, db)
-    return JSONResponse(
+    key = email.lower()
+    now = time.monotonic()
+    cached = _exists_cache.get(key)
+    if cached is not None and cached[0] > now:
+        exists = cached[1]
+    else:
+        exists = await check_user_exist(email, db)
+        if len(_exists_cache) >= _EXISTS_CACHE_MAX:
+            _exists_cache.clear()
+        _exists_cache[key] = (now + _EXISTS_CACHE_TTL, exists)
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "status": "success",
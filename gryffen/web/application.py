@@ -19,17 +19,27 @@
 from importlib import metadata
 from pathlib import Path
 from fastapi import FastAPI
-from fastapi.responses import UJSONResponse
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from gryffen.logging import configure_logging
+from gryffen.web.api.utils import ORJSONResponse
 from gryffen.web.api.router import router
 from gryffen.web.router import root_router
-from gryffen.web.lifetime import register_shutdown_event
-from gryffen.web.lifetime import register_startup_event
+from gryffen.web.lifetime import lifespan
 
 APP_ROOT = Path(__file__).parent.parent
 
+# Resolved once at import: metadata.version scans dist-info directories on
+# sys.path, which is wasteful to repeat for every get_app() call.
+_GRYFFEN_VERSION = metadata.version("gryffen")
+_STATIC_DIR = APP_ROOT / "static"
+
+# Matches the production front end plus localhost on any port; Starlette
+# compiles this once and checks each Origin header with a single regex
+# match instead of scanning an origin list.
+ORIGIN_REGEX = r"^(https://tradinglab\.app|http://localhost(:\d+)?)$"
+
 
 def get_app() -> FastAPI:
     """
@@ -42,16 +52,24 @@ def get_app() -> FastAPI:
     configure_logging()
     app = FastAPI(
         title="gryffen",
-        version=metadata.version("gryffen"),
+        version=_GRYFFEN_VERSION,
         docs_url=None,
         redoc_url="/api/v1/doc",
         openapi_url="/api/openapi.json",
-        default_response_class=UJSONResponse,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
-    # Adds startup and shutdown events.
-    register_startup_event(app)
-    register_shutdown_event(app)
+    # Middleware is registered at construction time; both CORS and GZip
+    # are pure ASGI classes, so no BaseHTTPMiddleware adapter is involved.
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origin_regex=ORIGIN_REGEX,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
     # Main router for the API.
     app.include_router(router=router, prefix="/api")
@@ -60,11 +78,9 @@ def get_app() -> FastAPI:
     # This directory is used to access swagger files.
     app.mount(
         "/static",
-        StaticFiles(directory=APP_ROOT / "static"),
+        StaticFiles(directory=_STATIC_DIR),
         name="static",
     )
 
-    app.add_middleware(GZipMiddleware)
-
     # Returns application.
     return app
@@ -16,22 +16,68 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Awaitable
-from typing import Callable
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
 from fastapi import FastAPI
 from pathlib import Path
+from tempfile import gettempdir
 from starlette.datastructures import URL
-from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import async_scoped_session
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
-from fastapi.templating import Jinja2Templates
+from sqlalchemy.pool import NullPool
+from loguru import logger
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import PackageLoader
+from jinja2 import select_autoescape
 from gryffen.settings import settings
 from gryffen.core.websocket.streamer import Listener
 
+# Installs uvloop's event-loop policy for launchers that bypass
+# __main__.py (plain `uvicorn gryffen.web.application:get_app`);
+# uvicorn itself is already started with --loop uvloop there.
+try:  # pragma: no cover
+    import uvloop
 
-global_listener = Listener()
-BASE_DIR = Path(__file__).resolve().parent
-template = Jinja2Templates(directory=str(Path(BASE_DIR, 'templates')))
+    uvloop.install()
+except ImportError:
+    pass
+
+
+@lru_cache(maxsize=1)
+def get_listener() -> Listener:
+    """Returns the process-wide Finnhub listener, built on first use."""
+    return Listener()
+
+
+@lru_cache(maxsize=1)
+def get_templates() -> Environment:
+    """Returns the template environment, built on first use.
+
+    Lazy construction keeps import of this module side-effect free and
+    lets tests swap the environment by clearing the cache. Templates
+    never change at runtime; disabling auto-reload skips the per-render
+    stat call and the cache keeps every compiled template hot.
+    """
+    # Persist compiled templates to disk so freshly forked uvicorn
+    # workers load bytecode instead of re-parsing the source.
+    cache_dir = Path(gettempdir(), "gryffen-jinja-cache")
+    cache_dir.mkdir(exist_ok=True)
+    # PackageLoader resolves templates through importlib.resources, so
+    # packaged installs read them without per-lookup stat calls.
+    env = Environment(
+        loader=PackageLoader("gryffen.web", "templates"),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+    )
+    env.globals["URL"] = URL
+    return env
 
 
 def _setup_db(app: FastAPI) -> None:  # pragma: no cover
@@ -44,69 +90,94 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
 
     @param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
-    session_factory = async_sessionmaker(
-        engine,
-        expire_on_commit=False,
+    if settings.environment == "pytest":
+        # Tests open and tear down the app repeatedly; NullPool keeps no
+        # idle connections around, so teardown cannot deadlock on the pool.
+        engine = create_async_engine(
+            str(settings.db_url),
+            echo=settings.db_echo,
+            poolclass=NullPool,
+        )
+    else:
+        # Default pool sizing (5 + 10 overflow) stalls once ~15 requests
+        # hold sessions at the same time; registration alone keeps a
+        # session across several round-trips. Recycle connections before
+        # MySQL's idle timeout can close them server-side.
+        engine = create_async_engine(
+            str(settings.db_url),
+            echo=settings.db_echo,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=30,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+        )
+    # Scope sessions to the current asyncio task so the request dependency
+    # hands out one session per task instead of constructing a new one on
+    # every call.
+    session_factory = async_scoped_session(
+        async_sessionmaker(
+            engine,
+            expire_on_commit=False,
+        ),
+        scopefunc=asyncio.current_task,
     )
     app.state.db_engine = engine
     app.state.db_session_factory = session_factory
 
 
-def register_startup_event(
-    app: FastAPI,
-) -> Callable[[], Awaitable[None]]:  # pragma: no cover
-    """
-    Actions to run on application startup.
-
-    This function uses fastAPI app to store data
-    in the state, such as db_engine.
-
-    @param app: the fastAPI application.
-    :return: function that actually performs actions.
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # pragma: no cover
     """
+    Manages the application's startup and shutdown.
 
-    origins = [
-        "http://localhost",
-        "http://localhost:8080",
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "https://tradinglab.app",
-    ]
-
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-
-    @app.on_event("startup")
-    async def _startup() -> None:  # noqa: WPS430
-        _setup_db(app)
-        await global_listener.init()
-        await global_listener.start_listening()
-
-        template.env.globals["URL"] = URL
-        pass
-
-    return _startup
-
-
-def register_shutdown_event(
-    app: FastAPI,
-) -> Callable[[], Awaitable[None]]:  # pragma: no cover
-    """
-    Actions to run on application's shutdown.
+    Replaces the deprecated startup/shutdown event hooks with a single
+    context manager, which makes the initialization order explicit:
+    database engine, then the Finnhub listener (whose socket loop runs
+    as a background task, so startup is not held behind the websocket
+    handshake).
 
     @param app: fastAPI application.
-    @return: function that actually performs actions.
     """
-
-    @app.on_event("shutdown")
-    async def _shutdown() -> None:  # noqa: WPS430
-        await app.state.db_engine.dispose()
-        pass  # noqa: WPS420
-
-    return _shutdown
+    _setup_db(app)
+    if settings.environment != "pytest":
+        # The pool creates connections lazily, so without this the first
+        # pool_size requests each pay a MySQL handshake. Checking out and
+        # releasing pool_size connections leaves the pool fully populated
+        # before traffic arrives.
+        warm = [
+            await app.state.db_engine.connect()
+            for _ in range(settings.db_pool_size)
+        ]
+        await asyncio.gather(*(conn.close() for conn in warm))
+    # The mail service is built lazily by get_mail_service on first send;
+    # constructing it here would make boot require Gmail credentials even
+    # in environments that never send mail.
+    app.state.mail_service = None
+    # The landing page is static, so render it once here and let the
+    # root handler hand back the same bytes for every request.
+    home_template = get_templates().get_template("home.html")
+    app.state.home_bytes = home_template.render().encode("utf-8")
+    app.state.home_etag = '"{0}"'.format(
+        hashlib.blake2b(app.state.home_bytes, digest_size=8).hexdigest(),
+    )
+    listener = get_listener()
+    await listener.init()
+    # start_listening() only spawns the socket loop as a task, so startup
+    # (and the readiness probe) never waits on the websocket handshake.
+    await listener.start_listening()
+    app.state.listener_task = listener.listener_task
+
+    yield
+
+    if app.state.listener_task is not None:
+        app.state.listener_task.cancel()
+        # Wait for the cancellation to land so the task is not destroyed
+        # mid-await while the engine below is being disposed.
+        await asyncio.gather(app.state.listener_task, return_exceptions=True)
+    # dispose() closes every idle pooled connection in turn; bound it so
+    # a wedged MySQL backend cannot hold up uvicorn's SIGTERM handling.
+    try:
+        await asyncio.wait_for(app.state.db_engine.dispose(), timeout=5.0)
+    except asyncio.TimeoutError:
+        logger.warning("Engine dispose timed out; abandoning idle connections.")